@@ -24,6 +24,7 @@ interface HealthStatus {
       status: 'healthy' | 'unhealthy' | 'degraded';
       latency?: number;
       error?: string;
+      cached?: boolean;
     };
     database?: {
       status: 'healthy' | 'unhealthy' | 'degraded';
@@ -56,7 +57,19 @@ async function checkAptosHealth(): Promise<{ status: 'healthy' | 'unhealthy'; la
   }
 }
 
-async function checkPythonHealth(): Promise<{ status: 'healthy' | 'unhealthy'; latency?: number; error?: string }> {
+// Most recent healthy Python probe result
+const PYTHON_HEALTH_CACHE_DURATION = 30000;
+let pythonHealthCache: { latency: number; timestamp: number } | null = null;
+
+async function checkPythonHealth(): Promise<{ status: 'healthy' | 'unhealthy'; latency?: number; error?: string; cached?: boolean }> {
+  if (pythonHealthCache && (Date.now() - pythonHealthCache.timestamp) < PYTHON_HEALTH_CACHE_DURATION) {
+    return {
+      status: 'healthy',
+      latency: pythonHealthCache.latency,
+      cached: true
+    };
+  }
+
   try {
     const start = performance.now();
     
@@ -73,8 +86,12 @@ async function checkPythonHealth(): Promise<{ status: 'healthy' | 'unhealthy'; l
       pythonProcess.on('close', (code) => {
         const latency = performance.now() - start;
         if (code === 0) {
+          const status = latency < 1000 ? 'healthy' : 'unhealthy';
+          if (status === 'healthy') {
+            pythonHealthCache = { latency, timestamp: Date.now() };
+          }
           resolve({
-            status: latency < 1000 ? 'healthy' : 'unhealthy',
+            status,
             latency
           });
         } else {
@@ -1,47 +1,32 @@
 import { NextResponse } from 'next/server';
+import { realMLServices } from '@/lib/real-ml-services';
 
 export async function GET() {
   try {
-    const baseUrl = process.env.VERCEL_URL ? `https://${process.env.VERCEL_URL}` : 'http://localhost:3000';
-    
-    // Test fee prediction
-    const feeTest = await fetch(`${baseUrl}/api/predict-ml`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        type: 'fee',
-        data: [0.5, 100, 0.7]
-      }),
-    });
-
-    // Test fraud detection
-    const fraudTest = await fetch(`${baseUrl}/api/predict-ml`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        type: 'fraud',
-        data: ['0x123abc', '0x456def', 1000, Math.floor(Date.now() / 1000)]
-      }),
-    });
+    // Probe fee prediction and fraud detection concurrently, in-process
+    const [feeProbe, fraudProbe] = await Promise.allSettled([
+      realMLServices.predictRealFee(0.5, 'APT', 'normal'),
+      realMLServices.detectRealFraud('0x123abc', '0x456def', 1000, Math.floor(Date.now() / 1000), true)
+    ]);
 
-    const feeResult = feeTest.ok ? await feeTest.json() : { error: 'Fee service unavailable' };
-    const fraudResult = fraudTest.ok ? await fraudTest.json() : { error: 'Fraud service unavailable' };
+    const feeResult = feeProbe.status === 'fulfilled' ? feeProbe.value : null;
+    const fraudResult = fraudProbe.status === 'fulfilled' ? fraudProbe.value : null;
 
     return NextResponse.json({
       status: 'healthy',
       timestamp: new Date().toISOString(),
       services: {
         fee_prediction: {
-          status: feeTest.ok ? 'operational' : 'degraded',
-          model: feeResult.model || 'unknown',
-          last_prediction: feeResult.fee || null,
-          confidence: feeResult.confidence || null
+          status: feeResult ? 'operational' : 'degraded',
+          model: feeResult?.model || 'unknown',
+          last_prediction: feeResult?.predicted_fee || null,
+          confidence: feeResult?.confidence || null
         },
         fraud_detection: {
-          status: fraudTest.ok ? 'operational' : 'degraded',
-          model: fraudResult.model || 'unknown',
-          last_risk_score: fraudResult.risk_score || null,
-          confidence: fraudResult.confidence || null
+          status: fraudResult ? 'operational' : 'degraded',
+          model: fraudResult?.model || 'unknown',
+          last_risk_score: fraudResult?.risk_score || null,
+          confidence: fraudResult?.confidence || null
         }
       },
       capabilities: [
@@ -52,7 +37,7 @@ export async function GET() {
         'Pattern recognition'
       ],
       security_metrics: {
-        models_active: (feeTest.ok ? 1 : 0) + (fraudTest.ok ? 1 : 0),
+        models_active: (feeResult ? 1 : 0) + (fraudResult ? 1 : 0),
         total_endpoints: 2,
         last_health_check: new Date().toISOString()
       }
@@ -1,10 +1,18 @@
 import { NextResponse, NextRequest } from 'next/server';
 import { realMLServices } from '@/lib/real-ml-services';
+import { logger } from '@/lib/logger';
 
 // Rate limiting configuration
 const REQUEST_CACHE = new Map<string, { count: number; lastReset: number }>();
 const RATE_LIMIT = Number(process.env.RATE_LIMIT_REQUESTS_PER_MINUTE) || 60;
 const RATE_LIMIT_WINDOW = Number(process.env.RATE_LIMIT_WINDOW_MS) || 60000;
+const PREDICTION_TYPES: ReadonlySet<string> = new Set(['fee', 'fraud']);
+const MAX_BATCH_SIZE = Number(process.env.ML_MAX_BATCH_SIZE) || 50;
+const BATCH_CONCURRENCY = Math.max(1, Number(process.env.ML_BATCH_CONCURRENCY) || 4);
+
+// Dummy addresses for API compatibility
+const DUMMY_SENDER_ADDRESS = `0x${'1'.repeat(64)}`;
+const DUMMY_RECIPIENT_ADDRESS = `0x${'2'.repeat(64)}`;
 
 function getRateLimitKey(req: NextRequest): string {
   const forwarded = req.headers.get('x-forwarded-for');
@@ -12,32 +20,35 @@ function getRateLimitKey(req: NextRequest): string {
   return ip;
 }
 
-function checkRateLimit(key: string): boolean {
+// Charge `weight` requests against the caller's window; batch entries each count as one
+function checkRateLimit(key: string, weight: number = 1): boolean {
   const now = Date.now();
   const record = REQUEST_CACHE.get(key);
   
   if (!record || now - record.lastReset > RATE_LIMIT_WINDOW) {
-    REQUEST_CACHE.set(key, { count: 1, lastReset: now });
+    if (weight > RATE_LIMIT) {
+      return false;
+    }
+    REQUEST_CACHE.set(key, { count: weight, lastReset: now });
     return true;
   }
   
-  if (record.count >= RATE_LIMIT) {
+  if (record.count + weight > RATE_LIMIT) {
     return false;
   }
   
-  record.count++;
+  record.count += weight;
   return true;
 }
 
 interface PredictionResult {
   error?: string;
   status: string;
-  [key: string]: unknown;
 }
 
 async function getMLPrediction(type: string, data: unknown[]): Promise<PredictionResult> {
   try {
-    console.log(`Using real ML prediction for type: ${type}`, { data });
+    logger.debug('Using real ML prediction', { type, inputCount: data.length });
     
     if (type === 'fee') {
       // Handle different parameter formats for fee prediction
@@ -61,12 +72,8 @@ async function getMLPrediction(type: string, data: unknown[]): Promise<Predictio
         priority = String(param3);
       }
       
-      const result = await realMLServices.predictRealFee(amount, token, priority);
-      
-      return {
-        ...result,
-        status: 'success'
-      };
+      // Service results already carry status: 'success'
+      return await realMLServices.predictRealFee(amount, token, priority);
       
     } else if (type === 'fraud') {
       // Handle different parameter formats for fraud detection
@@ -89,17 +96,11 @@ async function getMLPrediction(type: string, data: unknown[]): Promise<Predictio
         // Legacy format: [amount, senderScore, recipientScore]
         amount = Number(param1);
         timestamp = Date.now() / 1000;
-        // Generate dummy addresses for API compatibility
-        sender = `0x${'1'.repeat(64)}`;
-        recipient = `0x${'2'.repeat(64)}`;
+        sender = DUMMY_SENDER_ADDRESS;
+        recipient = DUMMY_RECIPIENT_ADDRESS;
       }
       
-      const result = await realMLServices.detectRealFraud(sender, recipient, amount, timestamp);
-      
-      return {
-        ...result,
-        status: 'success'
-      };
+      return await realMLServices.detectRealFraud(sender, recipient, amount, timestamp);
     }
     
     return {
@@ -117,6 +118,25 @@ async function getMLPrediction(type: string, data: unknown[]): Promise<Predictio
   }
 }
 
+// Run batch entries through a small pool of workers so a batch never has more than
+// BATCH_CONCURRENCY predictions hitting upstream APIs at once
+async function getBatchMLPredictions(type: string, batch: unknown[][]): Promise<PredictionResult[]> {
+  const results: PredictionResult[] = new Array(batch.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < batch.length) {
+      const index = nextIndex++;
+      results[index] = await getMLPrediction(type, batch[index]);
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(BATCH_CONCURRENCY, batch.length) }, worker)
+  );
+  return results;
+}
+
 export async function POST(req: NextRequest) {
   try {
     // Rate limiting
@@ -147,15 +167,49 @@ export async function POST(req: NextRequest) {
       );
     }
 
-    const { type, data } = body as { type?: string; data?: unknown };
+    const { type, data, batch } = body as { type?: string; data?: unknown; batch?: unknown };
 
-    if (!type || !['fee', 'fraud'].includes(type)) {
+    if (!type || !PREDICTION_TYPES.has(type)) {
       return NextResponse.json(
         { error: 'Invalid prediction type. Must be "fee" or "fraud"' },
         { status: 400 }
       );
     }
 
+    // Batch mode: evaluate several inputs of the same type in one round trip
+    if (batch !== undefined) {
+      if (!Array.isArray(batch) || batch.length === 0 || batch.length > MAX_BATCH_SIZE) {
+        return NextResponse.json(
+          { error: `Batch must be a non-empty array of at most ${MAX_BATCH_SIZE} entries` },
+          { status: 400 }
+        );
+      }
+
+      if (!batch.every((entry) => Array.isArray(entry))) {
+        return NextResponse.json(
+          { error: 'Each batch entry must be an array' },
+          { status: 400 }
+        );
+      }
+
+      // The request itself was charged once above; charge the remaining entries
+      if (!checkRateLimit(rateLimitKey, batch.length - 1)) {
+        return NextResponse.json(
+          { error: 'Rate limit exceeded. Please try again later.' },
+          { status: 429 }
+        );
+      }
+
+      const results = await getBatchMLPredictions(type, batch);
+
+      return NextResponse.json({
+        results,
+        count: results.length,
+        timestamp: new Date().toISOString(),
+        type,
+      });
+    }
+
     if (!Array.isArray(data)) {
       return NextResponse.json(
         { error: 'Data must be an array' },
@@ -203,7 +257,7 @@ export async function GET(req: NextRequest) {
     const type = searchParams.get('type');
     const dataParam = searchParams.get('data');
 
-    if (!type || !['fee', 'fraud'].includes(type)) {
+    if (!type || !PREDICTION_TYPES.has(type)) {
       return NextResponse.json(
         { error: 'Invalid prediction type. Must be "fee" or "fraud"' },
         { status: 400 }
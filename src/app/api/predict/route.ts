@@ -1,10 +1,16 @@
 import { NextResponse, NextRequest } from "next/server";
 import { realMLServices } from "@/lib/real-ml-services";
+import { logger } from "@/lib/logger";
 
 // Rate limiting configuration
 const REQUEST_CACHE = new Map<string, { count: number; lastReset: number }>();
 const RATE_LIMIT = Number(process.env.RATE_LIMIT_REQUESTS_PER_MINUTE) || 60;
 const RATE_LIMIT_WINDOW = Number(process.env.RATE_LIMIT_WINDOW_MS) || 60000;
+const PREDICTION_TYPES: ReadonlySet<string> = new Set(["fee", "fraud"]);
+
+// Dummy addresses for API compatibility
+const DUMMY_SENDER_ADDRESS = `0x${"1".repeat(64)}`;
+const DUMMY_RECIPIENT_ADDRESS = `0x${"2".repeat(64)}`;
 
 function getRateLimitKey(req: NextRequest): string {
   const forwarded = req.headers.get("x-forwarded-for");
@@ -44,8 +50,10 @@ function validatePredictionData(data: unknown): {
 
   const parsed: number[] = [];
   for (let i = 0; i < data.length; i++) {
-    const num = parseFloat(data[i]);
-    if (isNaN(num) || !isFinite(num)) {
+    // Parse string inputs; numbers are used as-is
+    const value = data[i];
+    const num = typeof value === "number" ? value : parseFloat(value);
+    if (!Number.isFinite(num)) {
       return { valid: false, error: `Invalid number at position ${i}` };
     }
     parsed.push(num);
@@ -58,62 +66,53 @@ async function callVercelPythonFunction(
   type: string,
   data: number[]
 ): Promise<unknown> {
-  try {
-    // Use real ML services directly - no more fallbacks
-    console.log("Using real ML services for prediction");
-
-    if (type === "fee") {
-      const [amount = 100, , priority = 0.5] = data;
+  // Use real ML services directly - no more fallbacks
+  logger.debug("Using real ML services for prediction", { type });
 
-      // Map priority from 0-1 to low/normal/high
-      const priorityStr =
-        priority > 0.7 ? "high" : priority < 0.3 ? "low" : "normal";
+  if (type === "fee") {
+    const [amount = 100, , priority = 0.5] = data;
 
-      const result = await realMLServices.predictRealFee(
-        amount,
-        "APT",
-        priorityStr
-      );
+    // Map priority from 0-1 to low/normal/high
+    const priorityStr =
+      priority > 0.7 ? "high" : priority < 0.3 ? "low" : "normal";
 
-      return {
-        fee: result.predicted_fee,
-        confidence: result.confidence,
-        model: result.model,
-        status: result.status,
-        factors: result.factors,
-        data_sources: result.data_sources,
-      };
-    } else if (type === "fraud") {
-      const [amount = 0] = data;
-
-      // Generate dummy addresses for API compatibility
-      const sender = `0x${"1".repeat(64)}`;
-      const recipient = `0x${"2".repeat(64)}`;
-
-      const result = await realMLServices.detectRealFraud(
-        sender,
-        recipient,
-        amount,
-        Date.now() / 1000
-      );
+    const result = await realMLServices.predictRealFee(
+      amount,
+      "APT",
+      priorityStr
+    );
 
-      return {
-        risk_score: result.risk_score,
-        is_suspicious: result.is_suspicious,
-        is_high_risk: result.is_high_risk,
-        confidence: result.confidence,
-        model: result.model,
-        status: result.status,
-        analysis: result.analysis,
-        data_sources: result.data_sources,
-      };
-    }
+    return {
+      fee: result.predicted_fee,
+      confidence: result.confidence,
+      model: result.model,
+      status: result.status,
+      factors: result.factors,
+      data_sources: result.data_sources,
+    };
+  } else if (type === "fraud") {
+    const [amount = 0] = data;
+
+    const result = await realMLServices.detectRealFraud(
+      DUMMY_SENDER_ADDRESS,
+      DUMMY_RECIPIENT_ADDRESS,
+      amount,
+      Date.now() / 1000
+    );
 
-    throw new Error(`Unsupported prediction type: ${type}`);
-  } catch (error) {
-    console.error("Real ML service failed:", error);
-    throw new Error(`ML prediction failed: ${error}`);
+    return {
+      risk_score: result.risk_score,
+      is_suspicious: result.is_suspicious,
+      is_high_risk: result.is_high_risk,
+      confidence: result.confidence,
+      model: result.model,
+      status: result.status,
+      analysis: result.analysis,
+      data_sources: result.data_sources,
+    };
   }
+
+  throw new Error(`Unsupported prediction type: ${type}`);
 }
 
 export async function GET(req: NextRequest) {
@@ -132,7 +131,7 @@ export async function GET(req: NextRequest) {
     const dataParam = searchParams.get("data");
 
     // Validate prediction type
-    if (!type || !["fee", "fraud"].includes(type)) {
+    if (!type || !PREDICTION_TYPES.has(type)) {
       return NextResponse.json(
         { error: 'Invalid prediction type. Must be "fee" or "fraud"' },
         { status: 400 }
@@ -232,7 +231,7 @@ export async function POST(req: NextRequest) {
 
     const { type, data } = body as { type?: string; data?: unknown };
 
-    if (!type || !["fee", "fraud"].includes(type)) {
+    if (!type || !PREDICTION_TYPES.has(type)) {
       return NextResponse.json(
         { error: 'Invalid prediction type. Must be "fee" or "fraud"' },
         { status: 400 }
@@ -2,6 +2,7 @@ import { NextResponse, NextRequest } from 'next/server';
 import { AptosClient, Types } from 'aptos';
 import { validator, apiSchemas } from '@/lib/validation';
 import { logger, generateRequestId, createPerformanceTimer, metrics } from '@/lib/logger';
+import { realMLServices } from '@/lib/real-ml-services';
 import { 
   handleApiError, 
   ValidationError, 
@@ -76,30 +77,12 @@ async function predictTransactionFee(
   amount: number
 ): Promise<{ fee: number; confidence: number; model: string } | null> {
   try {
-    const baseUrl = process.env.VERCEL_URL ? `https://${process.env.VERCEL_URL}` : 'http://localhost:3000';
-    
-    const response = await fetch(`${baseUrl}/api/predict-ml`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        type: 'fee',
-        data: [amount, 'APT', 'high'] // amount, token, priority
-      }),
-    });
-
-    if (!response.ok) {
-      logger.warn('Fee prediction service unavailable', { status: response.status });
-      return null;
-    }
+    const result = await realMLServices.predictRealFee(amount, 'APT', 'high');
 
-    const result = await response.json();
-    
     return {
-      fee: result.fee || result.prediction || 0.001,
-      confidence: result.confidence || 0.8,
-      model: result.model || 'ml_prediction'
+      fee: result.predicted_fee,
+      confidence: result.confidence,
+      model: result.model
     };
   } catch (error) {
     logger.warn('Fee prediction failed', { error: error instanceof Error ? error.message : String(error) });
@@ -113,25 +96,29 @@ async function checkTransactionFraud(
   amount: number
 ): Promise<FraudCheckResult | null> {
   try {
-    const baseUrl = process.env.VERCEL_URL ? `https://${process.env.VERCEL_URL}` : 'http://localhost:3000';
-    
-    const response = await fetch(`${baseUrl}/api/predict-ml`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        type: 'fraud',
-        data: [senderAddress, recipientAddress, amount, Math.floor(Date.now() / 1000)]
-      }),
-    });
-
-    if (!response.ok) {
-      logger.warn('Fraud detection service unavailable', { status: response.status });
-      return null;
-    }
+    const timestamp = Math.floor(Date.now() / 1000);
+    const detection = await realMLServices.detectRealFraud(
+      senderAddress,
+      recipientAddress,
+      amount,
+      timestamp
+    );
 
-    const result = await response.json() as FraudCheckResult;
+    const result: FraudCheckResult = {
+      risk_score: detection.risk_score,
+      is_fraud: detection.is_suspicious,
+      is_high_risk: detection.is_high_risk,
+      confidence: detection.confidence,
+      model: detection.model,
+      status: detection.status,
+      risk_factors: detection.analysis.anomaly_indicators,
+      analysis: {
+        amount,
+        sender_length: senderAddress.length,
+        recipient_length: recipientAddress.length,
+        timestamp
+      }
+    };
     
     logger.info('Fraud check completed', {
       risk_score: result.risk_score,
@@ -3,6 +3,8 @@
  * No fallbacks - only real data and ML models
  */
 
+import { logger } from '@/lib/logger';
+
 interface HuggingFaceResponse {
   generated_text?: string;
   score?: number;
@@ -30,7 +32,7 @@ interface FeePredictionResult {
     priority_multiplier: number;
     gas_price: number;
   };
-  data_sources: string[];
+  data_sources: readonly string[];
   timestamp: string;
   status: string;
 }
@@ -48,7 +50,7 @@ interface FraudDetectionResult {
     market_context: MarketContext;
     anomaly_indicators: string[];
   };
-  data_sources: string[];
+  data_sources: readonly string[];
   timestamp: string;
   status: string;
 }
@@ -99,26 +101,131 @@ interface Protocol {
 
 interface TransactionData {
   type: string;
+  timestamp: string;
   payload?: {
     arguments?: string[];
   };
 }
 
+interface AccountTransactions {
+  ok: boolean;
+  transactions: TransactionData[];
+}
+
 interface PriceCacheEntry {
   data: { usd: number; usd_24h_change: number };
   timestamp: number;
 }
 
+interface ValueCacheEntry {
+  value: number;
+  timestamp: number;
+}
+
+interface ReputationCacheEntry {
+  data: ReputationData;
+  timestamp: number;
+}
+
+interface FraudCacheEntry {
+  result: FraudDetectionResult;
+  timestamp: number;
+}
+
+// Set to false by any fraud sub-lookup that had to fall back to default values
+interface FraudLookupStatus {
+  complete: boolean;
+}
+
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+const ACCOUNT_HISTORY_LIMIT = 100;
+const PATTERN_HISTORY_LIMIT = 50;
+const HUGGINGFACE_MODEL_URL = 'https://api-inference.huggingface.co/models/google/flan-t5-small';
+
+// Data sources reported with every prediction
+const FEE_DATA_SOURCES: readonly string[] = Object.freeze(['Aptos Network', 'CoinGecko', 'Hugging Face']);
+const FRAUD_DATA_SOURCES: readonly string[] = Object.freeze(['Aptos Network', 'CoinGecko', 'Hugging Face', 'DefiLlama']);
+
+// Reasonable price defaults when CoinGecko is unreachable
+const FALLBACK_TOKEN_PRICES: ReadonlyMap<string, { usd: number; usd_24h_change: number }> = new Map([
+  ['apt', { usd: 8.5, usd_24h_change: 2.1 }],
+  ['usdc', { usd: 1.0, usd_24h_change: 0.1 }],
+  ['usdt', { usd: 1.0, usd_24h_change: 0.1 }],
+  ['btc', { usd: 65000, usd_24h_change: 1.5 }],
+  ['eth', { usd: 3500, usd_24h_change: 2.0 }],
+]);
+
+// Fee multipliers by transaction priority; unknown priorities are treated as normal
+const PRIORITY_MULTIPLIERS: ReadonlyMap<string, number> = new Map([
+  ['high', 2.5],
+  ['normal', 1.0],
+  ['low', 0.5],
+]);
+
+function getPriorityMultiplier(priority: string): number {
+  return PRIORITY_MULTIPLIERS.get(priority) ?? 1.0;
+}
+
+// CoinGecko ids for common token symbols; unknown symbols are passed through lowercased
+const COINGECKO_TOKEN_IDS: ReadonlyMap<string, string> = new Map([
+  ['apt', 'aptos'],
+  ['usdc', 'usd-coin'],
+  ['usdt', 'tether'],
+  ['btc', 'bitcoin'],
+  ['eth', 'ethereum'],
+]);
+
+// Look up a fresh entry in a Map used as an LRU cache, marking it as most recently used
+function getBoundedCacheEntry<V extends { timestamp: number }>(
+  cache: Map<string, V>,
+  key: string,
+  ttl: number
+): V | undefined {
+  const entry = cache.get(key);
+  if (!entry) return undefined;
+
+  cache.delete(key);
+  if (Date.now() - entry.timestamp >= ttl) return undefined;
+
+  cache.set(key, entry);
+  return entry;
+}
+
+// Insert into a Map used as an LRU cache, evicting least recently used entries once full
+function setBoundedCacheEntry<V>(cache: Map<string, V>, key: string, value: V, maxEntries: number): void {
+  cache.delete(key);
+  cache.set(key, value);
+
+  while (cache.size > maxEntries) {
+    const oldestKey = cache.keys().next().value;
+    if (oldestKey === undefined) break;
+    cache.delete(oldestKey);
+  }
+}
+
 class RealMLServices {
   private huggingFaceKey: string;
+  private huggingFaceHeaders: Record<string, string>;
   private coinGeckoKey: string | undefined;
   private priceCache: Map<string, PriceCacheEntry> = new Map();
+  private pendingPriceRequests: Map<string, Promise<{ usd: number; usd_24h_change: number }>> = new Map();
+  private historicalFeesCache: ValueCacheEntry | null = null;
+  private congestionCache: ValueCacheEntry | null = null;
+  private fraudCache: Map<string, FraudCacheEntry> = new Map();
+  private reputationCache: Map<string, ReputationCacheEntry> = new Map();
   private lastApiCall: number = 0;
   private readonly RATE_LIMIT_DELAY = 1200; // 1.2 seconds between calls for free tier
   private readonly CACHE_DURATION = 60000; // 1 minute cache
+  private readonly FRAUD_CACHE_MAX_ENTRIES = 1000;
+  private readonly REPUTATION_CACHE_MAX_ENTRIES = 1000;
+  private readonly CONGESTION_CACHE_DURATION = 15000; // Block activity changes quickly
 
   constructor() {
     this.huggingFaceKey = process.env.HUGGINGFACE_API_KEY || '';
+    this.huggingFaceHeaders = {
+      'Authorization': `Bearer ${this.huggingFaceKey}`,
+      'Content-Type': 'application/json',
+    };
     this.coinGeckoKey = process.env.COINGECKO_API_KEY;
     
     if (!this.huggingFaceKey) {
@@ -127,16 +234,16 @@ class RealMLServices {
   }
 
   private async waitForRateLimit(): Promise<void> {
+    // Reserve the next call slot, then wait for it
     const now = Date.now();
-    const timeSinceLastCall = now - this.lastApiCall;
+    const scheduledAt = Math.max(now, this.lastApiCall + this.RATE_LIMIT_DELAY);
+    this.lastApiCall = scheduledAt;
     
-    if (timeSinceLastCall < this.RATE_LIMIT_DELAY) {
-      const waitTime = this.RATE_LIMIT_DELAY - timeSinceLastCall;
-      console.log(`Rate limiting: waiting ${waitTime}ms before next API call`);
+    const waitTime = scheduledAt - now;
+    if (waitTime > 0) {
+      logger.debug('Rate limiting before next API call', { waitTime });
       await new Promise(resolve => setTimeout(resolve, waitTime));
     }
-    
-    this.lastApiCall = Date.now();
   }
 
   /**
@@ -144,14 +251,12 @@ class RealMLServices {
    */
   async predictRealFee(amount: number, token: string = 'APT', priority: string = 'normal'): Promise<FeePredictionResult> {
     try {
-      // Step 1: Get network congestion from Aptos
-      const networkCongestion = await this.getNetworkCongestion();
-      
-      // Step 2: Get real token price
-      const tokenPrice = await this.getRealTokenPrice(token);
-      
-      // Step 3: Get historical fees
-      const historicalMean = await this.getHistoricalFees();
+      // Steps 1-3: Get network congestion from Aptos, real token price and historical fees
+      const [networkCongestion, tokenPrice, historicalMean] = await Promise.all([
+        this.getNetworkCongestion(),
+        this.getRealTokenPrice(token),
+        this.getHistoricalFees()
+      ]);
       
       // Step 4: Prepare features for ML model
       const features: MLFeatures = {
@@ -174,10 +279,10 @@ class RealMLServices {
           network_congestion: networkCongestion,
           token_price: tokenPrice.usd,
           historical_mean: historicalMean,
-          priority_multiplier: priority === 'high' ? 2.5 : priority === 'low' ? 0.5 : 1.0,
+          priority_multiplier: getPriorityMultiplier(priority),
           gas_price: mlResult.fee / amount
         },
-        data_sources: ['Aptos Network', 'CoinGecko', 'Hugging Face'],
+        data_sources: FEE_DATA_SOURCES,
         timestamp: new Date().toISOString(),
         status: 'success'
       };
@@ -190,17 +295,35 @@ class RealMLServices {
   /**
    * Real Fraud Detection using ML models and reputation data
    */
-  async detectRealFraud(sender: string, recipient: string, amount: number, timestamp: number): Promise<FraudDetectionResult> {
+  async detectRealFraud(
+    sender: string,
+    recipient: string,
+    amount: number,
+    timestamp: number,
+    bypassCache: boolean = false
+  ): Promise<FraudDetectionResult> {
+    // Check cache first; cached verdicts are returned with a fresh timestamp
+    const cacheKey = `${sender}:${recipient}:${amount.toFixed(6)}`;
+    const cached = bypassCache
+      ? undefined
+      : getBoundedCacheEntry(this.fraudCache, cacheKey, this.CACHE_DURATION);
+    if (cached) {
+      return { ...cached.result, timestamp: new Date().toISOString() };
+    }
+
     try {
-      // Step 1: Get address reputations
-      const senderRep = await this.getAddressReputation(sender);
-      const recipientRep = await this.getAddressReputation(recipient);
-      
-      // Step 2: Analyze transaction patterns
-      const patterns = await this.analyzeTransactionPatterns(sender, amount);
-      
-      // Step 3: Get market context
-      const marketContext = await this.getMarketContext(amount);
+      const lookupStatus: FraudLookupStatus = { complete: true };
+      
+      // Steps 1-3: Get address reputations, transaction patterns and market context,
+      // sharing the sender's history (and reputation, for self-transfers)
+      const senderTransactions = this.fetchAccountTransactions(sender);
+      const senderRepLookup = this.getAddressReputation(sender, lookupStatus, senderTransactions);
+      const [senderRep, recipientRep, patterns, marketContext] = await Promise.all([
+        senderRepLookup,
+        recipient === sender ? senderRepLookup : this.getAddressReputation(recipient, lookupStatus),
+        this.analyzeTransactionPatterns(senderTransactions, amount, lookupStatus),
+        this.getMarketContext(amount, lookupStatus)
+      ]);
       
       // Step 4: Prepare features for anomaly detection
       const features: AnomalyFeatures = {
@@ -212,9 +335,9 @@ class RealMLServices {
       };
       
       // Step 5: Run anomaly detection ML model
-      const mlResult = await this.runAnomalyDetection(features);
+      const mlResult = await this.runAnomalyDetection(features, lookupStatus);
       
-      return {
+      const result: FraudDetectionResult = {
         risk_score: mlResult.risk,
         is_suspicious: mlResult.risk > 0.6,
         is_high_risk: mlResult.risk > 0.8,
@@ -227,20 +350,36 @@ class RealMLServices {
           market_context: marketContext,
           anomaly_indicators: mlResult.indicators
         },
-        data_sources: ['Aptos Network', 'CoinGecko', 'Hugging Face', 'DefiLlama'],
+        data_sources: FRAUD_DATA_SOURCES,
         timestamp: new Date().toISOString(),
         status: 'success'
       };
       
+      // Verdicts built from fallback values are not cached
+      if (lookupStatus.complete) {
+        this.cacheFraudResult(cacheKey, result);
+      }
+      return result;
+      
     } catch (error) {
       throw new Error(`ML Fraud detection failed: ${error}`);
     }
   }
 
+  private cacheFraudResult(key: string, result: FraudDetectionResult): void {
+    setBoundedCacheEntry(this.fraudCache, key, { result, timestamp: Date.now() }, this.FRAUD_CACHE_MAX_ENTRIES);
+  }
+
   /**
    * Get real network congestion from Aptos
    */
   private async getNetworkCongestion(): Promise<number> {
+    // Check cache first
+    const cached = this.congestionCache;
+    if (cached && (Date.now() - cached.timestamp) < this.CONGESTION_CACHE_DURATION) {
+      return cached.value;
+    }
+
     try {
       // Get ledger info for network metrics
       const response = await fetch('https://fullnode.testnet.aptoslabs.com/v1/');
@@ -256,7 +395,9 @@ class RealMLServices {
       const txCount = blockData.transactions?.length || 0;
       
       // Normalize congestion score (0-1)
-      return Math.min(txCount / 100, 1.0);
+      const congestion = Math.min(txCount / 100, 1.0);
+      this.congestionCache = { value: congestion, timestamp: Date.now() };
+      return congestion;
       
     } catch (error) {
       console.error('Failed to get network congestion:', error);
@@ -265,34 +406,40 @@ class RealMLServices {
   }
 
   /**
-   * Get real token price from CoinGecko
+   * Get real token price from CoinGecko, sharing one lookup between concurrent callers
    */
-  private async getRealTokenPrice(token: string): Promise<{ usd: number; usd_24h_change: number }> {
+  private getRealTokenPrice(token: string): Promise<{ usd: number; usd_24h_change: number }> {
+    const cacheKey = token.toLowerCase();
+    const pending = this.pendingPriceRequests.get(cacheKey);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchTokenPrice(token, cacheKey).finally(() => {
+      this.pendingPriceRequests.delete(cacheKey);
+    });
+    this.pendingPriceRequests.set(cacheKey, request);
+    return request;
+  }
+
+  /**
+   * Fetch token price from the price cache or CoinGecko; cacheKey is the lowercased symbol
+   */
+  private async fetchTokenPrice(
+    token: string,
+    cacheKey: string
+  ): Promise<{ usd: number; usd_24h_change: number }> {
     try {
       // Check cache first
-      const cacheKey = token.toLowerCase();
       const cached = this.priceCache.get(cacheKey);
       
       if (cached && (Date.now() - cached.timestamp) < this.CACHE_DURATION) {
-        console.log(`Using cached price for ${token}`);
+        logger.debug('Using cached token price', { token });
         return cached.data;
       }
 
       // Map common tokens and handle edge cases
-      let tokenId: string;
-      if (token.toLowerCase() === 'apt' || token === 'APT') {
-        tokenId = 'aptos';
-      } else if (token.toLowerCase() === 'usdc') {
-        tokenId = 'usd-coin';
-      } else if (token.toLowerCase() === 'usdt') {
-        tokenId = 'tether';
-      } else if (token.toLowerCase() === 'btc') {
-        tokenId = 'bitcoin';
-      } else if (token.toLowerCase() === 'eth') {
-        tokenId = 'ethereum';
-      } else {
-        tokenId = token.toLowerCase();
-      }
+      const tokenId = COINGECKO_TOKEN_IDS.get(cacheKey) ?? cacheKey;
       
       // Apply rate limiting
       await this.waitForRateLimit();
@@ -307,7 +454,7 @@ class RealMLServices {
         
         // If Pro API fails, fallback to free API
         if (!response.ok) {
-          console.log('Pro API failed, trying free API...');
+          logger.debug('CoinGecko Pro API failed, trying free API', { token });
           await this.waitForRateLimit(); // Additional rate limit for fallback
           url = `https://api.coingecko.com/api/v3/simple/price?ids=${tokenId}&vs_currencies=usd&include_24hr_change=true`;
           response = await fetch(url);
@@ -322,11 +469,11 @@ class RealMLServices {
         if (response.status === 429) {
           console.warn(`CoinGecko rate limit hit for ${token}`);
           if (cached) {
-            console.log(`Using stale cached data for ${token}`);
+            logger.debug('Using stale cached token price', { token });
             return cached.data;
           }
-          // Return fallback data for APT
-          const fallbackData = { usd: 8.45, usd_24h_change: 2.1 };
+          // Return fallback data for the requested token
+          const fallbackData = FALLBACK_TOKEN_PRICES.get(cacheKey) ?? { usd: 1.0, usd_24h_change: 0.0 };
           this.priceCache.set(cacheKey, { data: fallbackData, timestamp: Date.now() });
           return fallbackData;
         }
@@ -352,16 +499,7 @@ class RealMLServices {
     } catch (error) {
       console.error('Failed to get token price:', error);
       // Return reasonable defaults based on token type
-      if (token.toLowerCase() === 'apt' || token === 'APT') {
-        return { usd: 8.5, usd_24h_change: 2.1 };
-      } else if (token.toLowerCase() === 'usdc' || token.toLowerCase() === 'usdt') {
-        return { usd: 1.0, usd_24h_change: 0.1 };
-      } else if (token.toLowerCase() === 'btc') {
-        return { usd: 65000, usd_24h_change: 1.5 };
-      } else if (token.toLowerCase() === 'eth') {
-        return { usd: 3500, usd_24h_change: 2.0 };
-      }
-      return { usd: 1.0, usd_24h_change: 0.0 };
+      return FALLBACK_TOKEN_PRICES.get(cacheKey) ?? { usd: 1.0, usd_24h_change: 0.0 };
     }
   }
 
@@ -369,6 +507,12 @@ class RealMLServices {
    * Get historical fees from DefiLlama protocols
    */
   private async getHistoricalFees(): Promise<number> {
+    // Check cache first
+    const cached = this.historicalFeesCache;
+    if (cached && (Date.now() - cached.timestamp) < this.CACHE_DURATION) {
+      return cached.value;
+    }
+
     try {
       const response = await fetch('https://api.llama.fi/protocols');
       const protocols = await response.json();
@@ -378,12 +522,14 @@ class RealMLServices {
         p.chains?.includes('Aptos') || p.name.toLowerCase().includes('aptos')
       );
       
+      let value = 0.001; // Default fee
       if (aptosProtocols.length > 0) {
         const fees = aptosProtocols.map((p: Protocol) => p.change_1d || 0);
-        return fees.reduce((a: number, b: number) => a + b, 0) / fees.length;
+        value = fees.reduce((a: number, b: number) => a + b, 0) / fees.length;
       }
       
-      return 0.001; // Default fee
+      this.historicalFeesCache = { value, timestamp: Date.now() };
+      return value;
       
     } catch (error) {
       console.error('Failed to get historical fees:', error);
@@ -408,13 +554,10 @@ Priority: ${features.priority}
 Result: `;
 
       const response = await fetch(
-        'https://api-inference.huggingface.co/models/google/flan-t5-small',
+        HUGGINGFACE_MODEL_URL,
         {
           method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${this.huggingFaceKey}`,
-            'Content-Type': 'application/json',
-          },
+          headers: this.huggingFaceHeaders,
           body: JSON.stringify({
             inputs: input,
             parameters: {
@@ -455,8 +598,8 @@ Result: `;
     // Fallback calculation based on features
     const baseFee = 0.001;
     const networkMultiplier = 1 + features.networkLoad;
-    const priorityMultiplier = features.priority === 'high' ? 2.5 : features.priority === 'low' ? 0.5 : 1.0;
-    const amountMultiplier = Math.log(features.amount + 1) / 10;
+    const priorityMultiplier = getPriorityMultiplier(features.priority);
+    const amountMultiplier = Math.log1p(features.amount) / 10;
     
     const fee = baseFee * networkMultiplier * priorityMultiplier * (1 + amountMultiplier);
     
@@ -466,25 +609,47 @@ Result: `;
     };
   }
 
+  /**
+   * Fetch the latest account transactions from Aptos
+   */
+  private async fetchAccountTransactions(address: string): Promise<AccountTransactions> {
+    const response = await fetch(
+      `https://fullnode.testnet.aptoslabs.com/v1/accounts/${address}/transactions?limit=${ACCOUNT_HISTORY_LIMIT}`
+    );
+
+    if (!response.ok) {
+      return { ok: false, transactions: [] };
+    }
+
+    return { ok: true, transactions: await response.json() };
+  }
+
   /**
    * Get address reputation based on transaction history
    */
-  private async getAddressReputation(address: string): Promise<ReputationData> {
+  private async getAddressReputation(
+    address: string,
+    lookupStatus: FraudLookupStatus,
+    transactionsLookup?: Promise<AccountTransactions>
+  ): Promise<ReputationData> {
+    // Check cache first
+    const cached = getBoundedCacheEntry(this.reputationCache, address, this.CACHE_DURATION);
+    if (cached) {
+      return cached.data;
+    }
+
     try {
       // Get account transactions
-      const response = await fetch(
-        `https://fullnode.testnet.aptoslabs.com/v1/accounts/${address}/transactions?limit=100`
-      );
+      const { ok, transactions } = await (transactionsLookup ?? this.fetchAccountTransactions(address));
       
-      if (!response.ok) {
+      if (!ok) {
+        lookupStatus.complete = false;
         return { score: 0.5, txCount: 0, age: 0 };
       }
       
-      const transactions = await response.json();
-      
       const txCount = transactions.length;
       const age = txCount > 0 ? 
-        Math.floor((Date.now() - parseInt(transactions[0].timestamp)) / (1000 * 60 * 60 * 24)) : 0;
+        Math.floor((Date.now() - parseInt(transactions[0].timestamp)) / MS_PER_DAY) : 0;
       
       // Calculate reputation score
       let score = 0.5; // Neutral start
@@ -494,14 +659,23 @@ Result: `;
       if (age > 30) score += 0.1;
       if (age > 90) score += 0.1;
       
-      return {
+      const reputation: ReputationData = {
         score: Math.min(score, 1.0),
         txCount,
         age
       };
       
+      setBoundedCacheEntry(
+        this.reputationCache,
+        address,
+        { data: reputation, timestamp: Date.now() },
+        this.REPUTATION_CACHE_MAX_ENTRIES
+      );
+      return reputation;
+      
     } catch (error) {
       console.error('Failed to get reputation:', error);
+      lookupStatus.complete = false;
       return { score: 0.5, txCount: 0, age: 0 };
     }
   }
@@ -509,30 +683,40 @@ Result: `;
   /**
    * Analyze transaction patterns for anomaly detection
    */
-  private async analyzeTransactionPatterns(address: string, amount: number): Promise<PatternAnalysis> {
+  private async analyzeTransactionPatterns(
+    transactionsLookup: Promise<AccountTransactions>,
+    amount: number,
+    lookupStatus: FraudLookupStatus
+  ): Promise<PatternAnalysis> {
     try {
-      const response = await fetch(
-        `https://fullnode.testnet.aptoslabs.com/v1/accounts/${address}/transactions?limit=50`
-      );
+      const { ok, transactions } = await transactionsLookup;
       
-      if (!response.ok) {
+      if (!ok) {
+        lookupStatus.complete = false;
         return { pattern: 'unknown', risk: 0.5 };
       }
       
-      const transactions = await response.json();
-      
-      // Extract transaction amounts
-      const amounts = transactions
-        .filter((tx: TransactionData) => tx.type === 'user_transaction')
-        .map((tx: TransactionData) => parseFloat(tx.payload?.arguments?.[1] || '0'))
-        .filter((amount: number) => amount > 0);
+      // Only the most recent transactions are compared (results are oldest first)
+      const recentTransactions = transactions.slice(-PATTERN_HISTORY_LIMIT);
+      
+      // Accumulate count, sum and max of positive user transaction amounts in one pass
+      let count = 0;
+      let total = 0;
+      let maxAmount = -Infinity;
+      for (const tx of recentTransactions) {
+        if (tx.type !== 'user_transaction') continue;
+        const txAmount = parseFloat(tx.payload?.arguments?.[1] || '0');
+        if (!(txAmount > 0)) continue;
+        count++;
+        total += txAmount;
+        if (txAmount > maxAmount) maxAmount = txAmount;
+      }
       
-      if (amounts.length === 0) {
+      if (count === 0) {
         return { pattern: 'no_history', risk: 0.7 };
       }
       
-      const avgAmount = amounts.reduce((a: number, b: number) => a + b, 0) / amounts.length;
-      const maxAmount = Math.max(...amounts);
+      const avgAmount = total / count;
       const deviation = Math.abs(amount - avgAmount) / avgAmount;
       
       let pattern = 'normal';
@@ -544,7 +728,7 @@ Result: `;
       } else if (deviation > 10) {
         pattern = 'unusual_amount';
         risk = 0.6;
-      } else if (amounts.length < 5) {
+      } else if (count < 5) {
         pattern = 'new_account';
         risk = 0.5;
       }
@@ -558,6 +742,7 @@ Result: `;
       
     } catch (error) {
       console.error('Failed to analyze patterns:', error);
+      lookupStatus.complete = false;
       return { pattern: 'error', risk: 0.7 };
     }
   }
@@ -565,99 +750,92 @@ Result: `;
   /**
    * Run anomaly detection ML model using Hugging Face
    */
-  private async runAnomalyDetection(features: AnomalyFeatures): Promise<{ risk: number; confidence: number; indicators: string[] }> {
-    try {
-      const indicators: string[] = [];
-      let risk = 0.3;
-      
-      // Analyze features for risk indicators
-      if (features.senderReputation < 0.3) {
-        indicators.push('Low sender reputation');
-        risk += 0.3;
-      }
-      
-      if (features.recipientReputation < 0.3) {
-        indicators.push('Low recipient reputation');
-        risk += 0.2;
-      }
-      
-      if (features.patterns.risk > 0.7) {
-        indicators.push('Unusual transaction pattern');
-        risk += 0.3;
-      }
-      
-      if (features.amount > 1000) {
-        indicators.push('Large transaction amount');
-        risk += 0.2;
-      }
+  private async runAnomalyDetection(
+    features: AnomalyFeatures,
+    lookupStatus: FraudLookupStatus
+  ): Promise<{ risk: number; confidence: number; indicators: string[] }> {
+    const indicators: string[] = [];
+    let risk = 0.3;
+    
+    // Analyze features for risk indicators
+    if (features.senderReputation < 0.3) {
+      indicators.push('Low sender reputation');
+      risk += 0.3;
+    }
+    
+    if (features.recipientReputation < 0.3) {
+      indicators.push('Low recipient reputation');
+      risk += 0.2;
+    }
+    
+    if (features.patterns.risk > 0.7) {
+      indicators.push('Unusual transaction pattern');
+      risk += 0.3;
+    }
+    
+    if (features.amount > 1000) {
+      indicators.push('Large transaction amount');
+      risk += 0.2;
+    }
 
-      // Use ML model if API key is available
-      if (this.huggingFaceKey) {
-        try {
-          const input = `Analyze transaction risk:
+    // Use ML model if API key is available
+    if (this.huggingFaceKey) {
+      try {
+        const input = `Analyze transaction risk:
 Amount: ${features.amount}
 Sender Score: ${features.senderReputation}
 Recipient Score: ${features.recipientReputation}
 Pattern: ${features.patterns.pattern}
 Risk Level:`;
 
-          const response = await fetch(
-            'https://api-inference.huggingface.co/models/google/flan-t5-small',
-            {
-              method: 'POST',
-              headers: {
-                'Authorization': `Bearer ${this.huggingFaceKey}`,
-                'Content-Type': 'application/json',
-              },
-              body: JSON.stringify({
-                inputs: input,
-                parameters: {
-                  max_new_tokens: 10,
-                  temperature: 0.1
-                }
-              }),
-            }
-          );
-
-          if (response.ok) {
-            const result: HuggingFaceResponse[] = await response.json();
-            
-            if (result[0]?.generated_text) {
-              // Adjust risk based on ML model response
-              const mlText = result[0].generated_text.toLowerCase();
-              if (mlText.includes('high') || mlText.includes('suspicious')) {
-                risk = Math.min(risk + 0.2, 1.0);
-                indicators.push('ML model flagged as high risk');
-              } else if (mlText.includes('low') || mlText.includes('safe')) {
-                risk = Math.max(risk - 0.1, 0.0);
+        const response = await fetch(
+          HUGGINGFACE_MODEL_URL,
+          {
+            method: 'POST',
+            headers: this.huggingFaceHeaders,
+            body: JSON.stringify({
+              inputs: input,
+              parameters: {
+                max_new_tokens: 10,
+                temperature: 0.1
               }
+            }),
+          }
+        );
+
+        if (response.ok) {
+          const result: HuggingFaceResponse[] = await response.json();
+          
+          if (result[0]?.generated_text) {
+            // Adjust risk based on ML model response
+            const mlText = result[0].generated_text.toLowerCase();
+            if (mlText.includes('high') || mlText.includes('suspicious')) {
+              risk = Math.min(risk + 0.2, 1.0);
+              indicators.push('ML model flagged as high risk');
+            } else if (mlText.includes('low') || mlText.includes('safe')) {
+              risk = Math.max(risk - 0.1, 0.0);
             }
           }
-        } catch (mlError) {
-          console.error('ML anomaly detection failed:', mlError);
+        } else {
+          lookupStatus.complete = false;
         }
+      } catch (mlError) {
+        console.error('ML anomaly detection failed:', mlError);
+        lookupStatus.complete = false;
       }
-      
-      return {
-        risk: Math.min(risk, 1.0),
-        confidence: 0.8,
-        indicators
-      };
-      
-    } catch (error) {
-      console.error('Anomaly detection failed:', error);
-      return {
-        risk: 0.5,
-        confidence: 0.6,
-        indicators: ['Analysis failed']
-      };
     }
+    
+    return {
+      risk: Math.min(risk, 1.0),
+      confidence: 0.8,
+      indicators
+    };
   }
 
   /**
    * Get market context for transaction amount
    */
-  private async getMarketContext(amount: number): Promise<MarketContext> {
+  private async getMarketContext(amount: number, lookupStatus: FraudLookupStatus): Promise<MarketContext> {
     try {
       const tokenPrice = await this.getRealTokenPrice('APT');
       const usdValue = amount * tokenPrice.usd;
@@ -672,6 +850,7 @@ Risk Level:`;
       
     } catch (error) {
       console.error('Failed to get market context:', error);
+      lookupStatus.complete = false;
       return {
         usd_value: amount * 8.5,
         is_large_transaction: false,